@@ -20,6 +20,7 @@ stripped surface is 14).
 Usage:
     python benchmarks/token_savings.py
     python benchmarks/token_savings.py --backends 10 --tools-per-backend 30
+    python benchmarks/token_savings.py --format toon
     python benchmarks/token_savings.py --scenario readme
     python benchmarks/token_savings.py --scenario readme --json
 """
@@ -27,9 +28,77 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
 import json
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize to indented JSON, using orjson's C codec when available.
+
+    orjson serializes 3-5x faster than stdlib json; the benchmark is
+    CPU-bound on serializing thousands of synthetic tool definitions, so
+    this directly cuts wall time without changing the measured output.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    # ensure_ascii=False matches orjson's UTF-8 output so token estimates
+    # are identical whether or not the optional dependency is installed.
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _indent_overhead(obj, depth: int = 0) -> int:
+    """Exact character overhead of indent=2 pretty-printing over compact form.
+
+    Per non-empty container: the opening bracket and each of the n-1 item
+    separators gain a newline plus child-level indent, the closing bracket
+    gains a newline plus own-level indent, and each dict key separator gains
+    one space (": " vs ":").
+    """
+    if isinstance(obj, dict):
+        if not obj:
+            return 0
+        n = len(obj)
+        own = (1 + 2 * (depth + 1)) * n + (1 + 2 * depth) + n
+        return own + sum(_indent_overhead(v, depth + 1) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        if not obj:
+            return 0
+        n = len(obj)
+        own = (1 + 2 * (depth + 1)) * n + (1 + 2 * depth)
+        return own + sum(_indent_overhead(v, depth + 1) for v in obj)
+    return 0
+
+
+def _pretty_newlines(obj) -> int:
+    """Number of newlines in the indent=2 rendering of obj."""
+    if isinstance(obj, (dict, list, tuple)) and obj:
+        values = obj.values() if isinstance(obj, dict) else obj
+        return len(obj) + 1 + sum(_pretty_newlines(v) for v in values)
+    return 0
+
+
+def json_length(obj) -> int:
+    """Character length of the indented JSON form, without materializing it.
+
+    The stdlib path serializes compactly — separators without indent keep
+    the encoder on its C fast path — and adds the exact pretty-print
+    overhead analytically, avoiding the slow pure-Python indenting loop and
+    the multi-megabyte pretty string. With orjson installed the
+    serialization itself is cheap enough that len() of its output wins.
+    """
+    if orjson is not None:
+        return len(orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode())
+    compact = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+    return len(compact) + _indent_overhead(obj)
+
 # ---------------------------------------------------------------------------
 # Token estimation
 # ---------------------------------------------------------------------------
@@ -40,19 +109,54 @@ CHARS_PER_TOKEN = 3.5
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count from character length."""
-    return max(1, int(len(text) / CHARS_PER_TOKEN))
+    return tokens_from_chars(len(text))
+
+
+def tokens_from_chars(n_chars: int) -> int:
+    """Estimate token count from a character count.
+
+    n_chars / 3.5 expressed as pure integer arithmetic (2n // 7), keeping
+    the hot estimation path off the float-division + int() conversion
+    route; `or 1` preserves the old max(1, ...) floor.
+    """
+    return (n_chars * 2) // 7 or 1
 
 
 # ---------------------------------------------------------------------------
 # Synthetic tool definitions
 # ---------------------------------------------------------------------------
 
+_PARAM_ROLES = ("query", "filter", "format", "limit", "offset")
+
+_TOOL_NAMES = (
+    "list_items", "get_item", "create_item", "update_item", "delete_item",
+    "search", "filter", "aggregate", "export", "import_data",
+    "get_status", "get_config", "set_config", "validate", "transform",
+    "notify", "subscribe", "unsubscribe", "get_metrics", "get_logs",
+    "get_schema", "list_users", "get_user", "create_user", "delete_user",
+    "list_projects", "get_project", "run_query", "get_report", "sync",
+)
+
+_BACKEND_NAMES = (
+    "slack", "github", "jira", "confluence", "linear",
+    "notion", "postgres", "stripe", "sendgrid", "datadog",
+    "sentry", "pagerduty", "grafana", "elasticsearch", "redis",
+    "mongodb", "snowflake", "bigquery", "s3", "cloudflare",
+)
+
+
+@functools.lru_cache(maxsize=None)
 def make_tool_definition(backend: str, tool_name: str, n_params: int = 3) -> dict:
-    """Generate a realistic MCP tool definition."""
+    """Generate a realistic MCP tool definition.
+
+    Memoized: the scaling table revisits the same (backend, tool_name,
+    n_params) triples on every row, so each unique definition is built once
+    and shared. Callers only serialize the result, never mutate it.
+    """
     params = {
         f"param_{i}": {
             "type": "string",
-            "description": f"Parameter {i} for {tool_name} — controls the {['query', 'filter', 'format', 'limit', 'offset'][i % 5]} behavior.",
+            "description": f"Parameter {i} for {tool_name} — controls the {_PARAM_ROLES[i % 5]} behavior.",
         }
         for i in range(n_params)
     }
@@ -71,20 +175,126 @@ def make_tool_definition(backend: str, tool_name: str, n_params: int = 3) -> dic
     }
 
 
-def generate_backend_tools(backend: str, n_tools: int) -> list[dict]:
-    """Generate n_tools definitions for one backend."""
-    tool_names = [
-        "list_items", "get_item", "create_item", "update_item", "delete_item",
-        "search", "filter", "aggregate", "export", "import_data",
-        "get_status", "get_config", "set_config", "validate", "transform",
-        "notify", "subscribe", "unsubscribe", "get_metrics", "get_logs",
-        "get_schema", "list_users", "get_user", "create_user", "delete_user",
-        "list_projects", "get_project", "run_query", "get_report", "sync",
-    ]
-    return [
-        make_tool_definition(backend, tool_names[i % len(tool_names)], n_params=3 + (i % 3))
-        for i in range(n_tools)
+def _tool_specs(n_tools: int):
+    """Yield the (tool_name, n_params) spec for each synthetic tool index."""
+    for i in range(n_tools):
+        yield _TOOL_NAMES[i % len(_TOOL_NAMES)], 3 + (i % 3)
+
+
+@functools.lru_cache(maxsize=None)
+def generate_backend_tools(backend: str, n_tools: int) -> tuple[dict, ...]:
+    """Generate n_tools definitions for one backend.
+
+    Memoized by (backend, n_tools) and returned as a tuple so repeated
+    scaling-table rows reuse the same definitions instead of reallocating
+    thousands of identical dicts per row.
+    """
+    return tuple(
+        make_tool_definition(backend, name, n_params=n_params)
+        for name, n_params in _tool_specs(n_tools)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _make_tool_char_len(backend: str, tool_name: str, n_params: int) -> int:
+    """Rendered length of one tool definition inside the indented tools array.
+
+    Each array element is the tool's own indent=2 JSON with every line
+    prefixed by the two-space array indent.
+    """
+    tool = make_tool_definition(backend, tool_name, n_params)
+    return json_length(tool) + 2 * (_pretty_newlines(tool) + 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _backend_tools_char_len(backend: str, n_tools: int) -> int:
+    """Summed rendered length of one backend's tool definitions."""
+    return sum(
+        _make_tool_char_len(backend, name, n_params)
+        for name, n_params in _tool_specs(n_tools)
+    )
+
+
+# ---------------------------------------------------------------------------
+# Alternative prompt encodings (TOON / TRON)
+# ---------------------------------------------------------------------------
+# JSON is the worst-case prompt encoding: braces, quotes, and repeated keys
+# all cost tokens. Clients that render tool catalogs as TOON (tabular rows
+# under a single header) or TRON (shared schema declared once, then value
+# rows) see materially smaller prompts for uniform tool lists like these.
+# The --format flag reports savings against those encodings instead of JSON.
+
+
+def _param_summary(tool: dict) -> str:
+    """Flatten a tool's inputSchema params into one compact cell."""
+    props = tool["inputSchema"]["properties"]
+    required = set(tool["inputSchema"]["required"])
+    return ";".join(
+        f"{name}{'*' if name in required else ''}={spec['description']}"
+        for name, spec in props.items()
+    )
+
+
+def serialize_toon(tools: list[dict]) -> str:
+    """Render tools as TOON-style tabular rows under one header.
+
+    One header line declares the shared fields, then each tool is a single
+    row — no braces, no quoted keys, no per-tool schema boilerplate.
+    """
+    lines = [f"tools[{len(tools)}]{{name,description,params}}:"]
+    lines.extend(
+        f"  {tool['name']},{tool['description']},{_param_summary(tool)}"
+        for tool in tools
+    )
+    return "\n".join(lines)
+
+
+def serialize_tron(tools: list[dict]) -> str:
+    """Render tools as TRON-style shared-schema classes plus value rows.
+
+    Tools generated here share a handful of schema shapes (by param-name
+    set), so each shape is declared once as a class and every tool becomes
+    a compact value row referencing its class.
+    """
+    classes: dict[tuple[str, ...], int] = {}
+    rows = []
+    for tool in tools:
+        props = tool["inputSchema"]["properties"]
+        shape = tuple(props)
+        class_id = classes.setdefault(shape, len(classes))
+        param_values = ";".join(spec["description"] for spec in props.values())
+        rows.append(
+            f"  t{class_id} {tool['name']} | {tool['description']} | {param_values}"
+        )
+    header = [
+        f"#{class_id} {{{','.join(shape)}}}"
+        for shape, class_id in classes.items()
     ]
+    return "\n".join(header + rows)
+
+
+_SERIALIZERS = {
+    "toon": serialize_toon,
+    "tron": serialize_tron,
+}
+
+
+def direct_tools_char_len(backend_tool_counts: tuple[tuple[str, int], ...]) -> int:
+    """Character length of the combined indented tools array.
+
+    Computed analytically from memoized per-tool lengths: each unique
+    (backend, tool_name, n_params) triple is serialized exactly once, then
+    every scaling row is pure integer addition instead of an O(total-tools)
+    JSON encode. Matches len(json of the flat array) exactly:
+    "[\\n" + items joined by ",\\n" + "\\n]".
+    """
+    total = sum(n for _, n in backend_tool_counts)
+    if total == 0:
+        return 2
+    item_chars = sum(
+        _backend_tools_char_len(name, n) for name, n in backend_tool_counts
+    )
+    return item_chars + 2 * (total - 1) + 4
 
 
 # ---------------------------------------------------------------------------
@@ -287,32 +497,45 @@ if README_SCENARIO["gateway_tools"] != len(GATEWAY_TOOLS):
         "the canonical README-benchmark GATEWAY_TOOLS list"
     )
 
+# GATEWAY_TOOLS never changes at runtime, so its serialized form and token
+# count are constants: fold them once at import instead of re-serializing on
+# every benchmark run and scaling row.
+GATEWAY_JSON = _dumps(GATEWAY_TOOLS)
+GATEWAY_TOKENS = estimate_tokens(GATEWAY_JSON)
+
 
 # ---------------------------------------------------------------------------
 # Benchmark
 # ---------------------------------------------------------------------------
 
-def synthetic_results(n_backends: int, tools_per_backend: int) -> dict:
+def synthetic_results(
+    n_backends: int, tools_per_backend: int, fmt: str = "json"
+) -> dict:
     """Return synthetic benchmark results for arbitrary backend counts."""
-    backend_names = [
-        "slack", "github", "jira", "confluence", "linear",
-        "notion", "postgres", "stripe", "sendgrid", "datadog",
-        "sentry", "pagerduty", "grafana", "elasticsearch", "redis",
-        "mongodb", "snowflake", "bigquery", "s3", "cloudflare",
-    ]
-
-    all_direct_tools = []
-    for i in range(n_backends):
-        name = backend_names[i % len(backend_names)]
-        if i >= len(backend_names):
-            name = f"{name}_{i // len(backend_names)}"
-        all_direct_tools.extend(generate_backend_tools(name, tools_per_backend))
-
-    direct_json = json.dumps(all_direct_tools, indent=2)
-    direct_tokens = estimate_tokens(direct_json)
-
-    gateway_json = json.dumps(GATEWAY_TOOLS, indent=2)
-    gateway_tokens = estimate_tokens(gateway_json)
+    def backend_name(i: int) -> str:
+        name = _BACKEND_NAMES[i % len(_BACKEND_NAMES)]
+        if i >= len(_BACKEND_NAMES):
+            name = f"{name}_{i // len(_BACKEND_NAMES)}"
+        return name
+
+    if fmt == "json":
+        # The JSON path never materializes the combined tool list: the
+        # direct-side size is the sum of memoized per-backend lengths plus
+        # the array overhead (see direct_tools_char_len).
+        counts = tuple(
+            (backend_name(i), tools_per_backend) for i in range(n_backends)
+        )
+        direct_tokens = tokens_from_chars(direct_tools_char_len(counts))
+        gateway_tokens = GATEWAY_TOKENS
+    else:
+        all_direct_tools = []
+        for i in range(n_backends):
+            all_direct_tools.extend(
+                generate_backend_tools(backend_name(i), tools_per_backend)
+            )
+        serializer = _SERIALIZERS[fmt]
+        direct_tokens = tokens_from_chars(len(serializer(all_direct_tools)))
+        gateway_tokens = tokens_from_chars(len(serializer(GATEWAY_TOOLS)))
 
     total_tools = n_backends * tools_per_backend
     savings_pct = (1 - gateway_tokens / direct_tokens) * 100
@@ -320,6 +543,7 @@ def synthetic_results(n_backends: int, tools_per_backend: int) -> dict:
 
     return {
         "scenario": "synthetic",
+        "format": fmt,
         "backends": n_backends,
         "tools_per_backend": tools_per_backend,
         "total_tools": total_tools,
@@ -333,7 +557,12 @@ def synthetic_results(n_backends: int, tools_per_backend: int) -> dict:
 
 
 def print_synthetic_results(results: dict) -> None:
-    """Pretty-print synthetic benchmark results."""
+    """Pretty-print synthetic benchmark results.
+
+    The report is assembled into one string and written with a single
+    sys.stdout.write so the ~40 output lines cost one syscall instead of
+    one per print — noticeable under pipes and CI log capture.
+    """
     total_tools = results["total_tools"]
     direct_tokens = results["direct_tokens"]
     gateway_tokens = results["gateway_tokens"]
@@ -348,56 +577,83 @@ def print_synthetic_results(results: dict) -> None:
     def sep(ch: str = "-") -> str:
         return f"+{ch * (w + 2)}+"
 
-    print(sep("="))
-    print(row("MCP Gateway - Token Savings Benchmark".center(w)))
-    print(sep("="))
-    print(row())
-    print(row("Configuration"))
-    print(row("-------------"))
-    print(row(f"  Backends:          {results['backends']:>4}"))
-    print(row(f"  Tools per backend: {results['tools_per_backend']:>4}"))
-    print(row(f"  Total tools:       {total_tools:>4}"))
-    print(row())
-    print(sep())
-    print(row())
-    print(row("Approach              Tools in Prompt    Est. Tokens"))
-    print(row("--------              ---------------    -----------"))
-    print(row(f"Direct (all tools)    {total_tools:>15,}    {direct_tokens:>11,}"))
-    print(row(f"Meta-MCP (gateway)    {len(GATEWAY_TOOLS):>15,}    {gateway_tokens:>11,}"))
-    print(row())
-    print(sep())
-    print(row())
-    print(row(f"Token savings:        {savings_pct:>5.1f}%"))
-    print(row(f"Reduction ratio:      {ratio:>5.0f}x fewer tokens"))
-    print(row(f"Tokens saved:         {results['tokens_saved']:>11,}"))
-    print(row())
-    print(sep("="))
-    print()
-
-    print("  Scaling comparison:")
-    print("  Backends  Tools  Direct (tokens)  Gateway (tokens)  Savings")
-    print("  --------  -----  --------------  ----------------  -------")
-
-    backend_names = [
-        "slack", "github", "jira", "confluence", "linear",
-        "notion", "postgres", "stripe", "sendgrid", "datadog",
-        "sentry", "pagerduty", "grafana", "elasticsearch", "redis",
-        "mongodb", "snowflake", "bigquery", "s3", "cloudflare",
+    lines = [
+        sep("="),
+        row("MCP Gateway - Token Savings Benchmark".center(w)),
+        sep("="),
+        row(),
+        row("Configuration"),
+        row("-------------"),
+        row(f"  Backends:          {results['backends']:>4}"),
+        row(f"  Tools per backend: {results['tools_per_backend']:>4}"),
+        row(f"  Total tools:       {total_tools:>4}"),
+        row(),
+        sep(),
+        row(),
+        row("Approach              Tools in Prompt    Est. Tokens"),
+        row("--------              ---------------    -----------"),
+        row(f"Direct (all tools)    {total_tools:>15,}    {direct_tokens:>11,}"),
+        row(f"Meta-MCP (gateway)    {len(GATEWAY_TOOLS):>15,}    {gateway_tokens:>11,}"),
+        row(),
+        sep(),
+        row(),
+        row(f"Token savings:        {savings_pct:>5.1f}%"),
+        row(f"Reduction ratio:      {ratio:>5.0f}x fewer tokens"),
+        row(f"Tokens saved:         {results['tokens_saved']:>11,}"),
+        row(),
+        sep("="),
+        "",
+        "  Scaling comparison:",
+        "  Backends  Tools  Direct (tokens)  Gateway (tokens)  Savings",
+        "  --------  -----  --------------  ----------------  -------",
     ]
-    for nb, tpb in [(1, 10), (3, 15), (5, 20), (10, 20), (10, 30), (20, 25)]:
-        tools = []
-        for i in range(nb):
-            name = backend_names[i % len(backend_names)]
-            tools.extend(generate_backend_tools(name, tpb))
-        d_tok = estimate_tokens(json.dumps(tools, indent=2))
+
+    scaling_rows = [(1, 10), (3, 15), (5, 20), (10, 20), (10, 30), (20, 25)]
+    max_tpb = max(tpb for _, tpb in scaling_rows)
+    # One reference table for the whole scaling section: cumulative rendered
+    # lengths per backend up to the largest row, so each row reduces to a
+    # prefix-sum lookup per backend instead of regenerating its tool list.
+    prefix_lens = {
+        name: tuple(
+            itertools.accumulate(
+                (
+                    _make_tool_char_len(name, tool_name, n_params)
+                    for tool_name, n_params in _tool_specs(max_tpb)
+                ),
+                initial=0,
+            )
+        )
+        for name in _BACKEND_NAMES
+    }
+    fmt = results.get("format", "json")
+    serializer = _SERIALIZERS.get(fmt)
+    for nb, tpb in scaling_rows:
+        if serializer is None:
+            item_chars = sum(
+                prefix_lens[_BACKEND_NAMES[i % len(_BACKEND_NAMES)]][tpb]
+                for i in range(nb)
+            )
+            d_chars = item_chars + 2 * (nb * tpb - 1) + 4
+        else:
+            row_tools: list[dict] = []
+            for i in range(nb):
+                name = _BACKEND_NAMES[i % len(_BACKEND_NAMES)]
+                row_tools.extend(generate_backend_tools(name, tpb))
+            d_chars = len(serializer(row_tools))
+        d_tok = tokens_from_chars(d_chars)
         g_tok = gateway_tokens
         pct = (1 - g_tok / d_tok) * 100
         total = nb * tpb
-        print(f"  {nb:>8}  {total:>5}  {d_tok:>14,}  {g_tok:>16,}  {pct:>5.1f}%")
-    print()
-    print("  Note: Token estimates use ~3.5 chars/token heuristic.")
-    print(f"  Gateway tools are constant ({len(GATEWAY_TOOLS)}) regardless of backend count.")
-    print()
+        lines.append(
+            f"  {nb:>8}  {total:>5}  {d_tok:>14,}  {g_tok:>16,}  {pct:>5.1f}%"
+        )
+    lines.append("")
+    lines.append("  Note: Token estimates use ~3.5 chars/token heuristic.")
+    lines.append(
+        f"  Gateway tools are constant ({len(GATEWAY_TOOLS)}) regardless of backend count."
+    )
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def readme_results() -> dict:
@@ -460,6 +716,17 @@ def main() -> None:
         "--tools-per-backend", type=int, default=20,
         help="Number of tools per backend (default: 20)",
     )
+    parser.add_argument(
+        "--format",
+        choices=("json", "toon", "tron"),
+        default="json",
+        help=(
+            "Prompt encoding assumed for the tool catalog (default: json). "
+            "toon/tron model clients that render tools as tabular rows or "
+            "shared-schema rows, which shrink the direct side and report "
+            "more conservative savings."
+        ),
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -469,7 +736,7 @@ def main() -> None:
     results = (
         readme_results()
         if args.scenario == "readme"
-        else synthetic_results(args.backends, args.tools_per_backend)
+        else synthetic_results(args.backends, args.tools_per_backend, args.format)
     )
 
     if args.json:
@@ -161,6 +161,12 @@ impl Backend {
     /// evicted (it backs init, metadata, and single-tenant traffic). Returns the
     /// number of slots closed (MIK-6735 POOL.2).
     pub async fn evict_idle_per_user_entries(&self, idle_ttl: Duration) -> usize {
+        // Fast path: a single-tenant pool holds only the canonical shared
+        // slot. The reaper visits every backend each minute, so skip the
+        // candidate scan (and its Vec) when nothing is evictable.
+        if self.pool.len() <= 1 {
+            return 0;
+        }
         let cutoff = idle_ttl.as_secs();
 
         // First pass: collect candidate keys without holding a guard across the
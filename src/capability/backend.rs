@@ -541,7 +541,9 @@ fn path_selector_type_error(
 }
 
 fn build_success_tool_result(capability: &CapabilityDefinition, result: Value) -> ToolsCallResult {
-    let text = serde_json::to_string_pretty(&result).unwrap_or_else(|_| result.to_string());
+    // Compact, not pretty: capability results are consumed by the model, and
+    // indentation inflates every response's token count.
+    let text = serde_json::to_string(&result).unwrap_or_else(|_| result.to_string());
     ToolsCallResult {
         content: vec![Content::Text {
             text,
@@ -9,9 +9,11 @@
 mod features;
 
 use std::{
+    borrow::Cow,
     collections::HashMap,
     env,
     path::{Path, PathBuf},
+    sync::LazyLock,
     time::Duration,
 };
 
@@ -249,29 +251,41 @@ impl Config {
 
     /// Expand `${VAR}` and `${VAR:-default}` patterns in config values.
     fn expand_env_vars(&mut self) {
-        let re = Regex::new(r"\$\{([A-Z_][A-Z0-9_]*)(?::-([^}]*))?\}").unwrap();
-
         for backend in self.backends.values_mut() {
             for value in backend.headers.values_mut() {
-                *value = Self::expand_string(&re, value);
+                Self::expand_string(value);
             }
             for value in backend.env.values_mut() {
-                *value = Self::expand_string(&re, value);
+                Self::expand_string(value);
             }
         }
 
         for dir in &mut self.capabilities.directories {
-            *dir = Self::expand_string(&re, dir);
+            Self::expand_string(dir);
         }
     }
 
-    fn expand_string(re: &Regex, value: &str) -> String {
-        re.replace_all(value, |caps: &regex::Captures| {
+    /// Expand `${VAR}` / `${VAR:-default}` placeholders in `value` in place.
+    ///
+    /// Strings without a placeholder — the common case for header values and
+    /// paths — are left untouched, with no regex scan and no reallocation.
+    fn expand_string(value: &mut String) {
+        // Compiled once for the process: expansion re-runs on every config
+        // reload, so the pattern should not be rebuilt per load.
+        static ENV_VAR_RE: LazyLock<Regex> =
+            LazyLock::new(|| Regex::new(r"\$\{([A-Z_][A-Z0-9_]*)(?::-([^}]*))?\}").unwrap());
+
+        if !value.contains('$') {
+            return;
+        }
+
+        if let Cow::Owned(expanded) = ENV_VAR_RE.replace_all(value, |caps: &regex::Captures| {
             let var_name = &caps[1];
             let default = caps.get(2).map_or("", |m| m.as_str());
             env::var(var_name).unwrap_or_else(|_| default.to_string())
-        })
-        .into_owned()
+        }) {
+            *value = expanded;
+        }
     }
 
     /// Get enabled backends only.
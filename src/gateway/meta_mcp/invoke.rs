@@ -228,9 +228,10 @@ fn apply_validated_output(result: &Value, validated: Value) -> Value {
     {
         text_obj.insert(
             "text".to_owned(),
-            Value::String(
-                serde_json::to_string_pretty(&validated).unwrap_or_else(|_| validated.to_string()),
-            ),
+            Value::String(serde_json::to_string(&validated).unwrap_or_else(|_| {
+                // Value::to_string is infallible compact serialization.
+                validated.to_string()
+            })),
         );
     }
     Value::Object(obj)
@@ -2707,7 +2708,7 @@ mod response_transform_tests {
         assert_eq!(result["structuredContent"]["issue"]["id"], json!("abc"));
         assert_eq!(
             result["content"][0]["text"],
-            json!("{\n  \"issue\": {\n    \"id\": \"abc\"\n  }\n}")
+            json!("{\"issue\":{\"id\":\"abc\"}}")
         );
     }
 
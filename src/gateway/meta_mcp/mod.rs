@@ -38,7 +38,7 @@ use crate::idempotency::{IdempotencyCache, spawn_cleanup_task};
 use crate::identity_grants::{GrantSubject, LocalIdentityGrantStore};
 use crate::kill_switch::{CapabilityErrorBudgetConfig, ErrorBudgetConfig, KillSwitch};
 use crate::playbook::PlaybookEngine;
-use crate::protocol::{JsonRpcResponse, LoggingLevel, RequestId, negotiate_version};
+use crate::protocol::{JsonRpcResponse, LoggingLevel, RequestId, Tool, negotiate_version};
 use crate::ranking::SearchRanker;
 use crate::routing_profile::{ProfileRegistry, SessionProfileStore};
 use crate::security::message_signing::{MessageSigner, NonceStore};
@@ -52,9 +52,9 @@ use crate::trust::{
 use crate::{Error, Result};
 
 use super::meta_mcp_helpers::{
-    build_code_mode_tools, build_discovery_preamble, build_initialize_result, build_meta_tools,
-    build_routing_instructions, did_you_mean, extract_client_version, extract_required_str,
-    wrap_tool_success,
+    build_discovery_preamble, build_initialize_result, build_meta_tools,
+    build_routing_instructions, code_mode_tools, did_you_mean, extract_client_version,
+    extract_required_str, wrap_tool_success,
 };
 use super::webhooks::WebhookRegistry;
 
@@ -1001,21 +1001,23 @@ impl MetaMcp {
         id: RequestId,
         session_id: Option<&str>,
     ) -> JsonRpcResponse {
-        let tools = if self.code_mode_enabled {
-            build_code_mode_tools()
+        let built_meta_tools;
+        let tools: &[Tool] = if self.code_mode_enabled {
+            code_mode_tools()
         } else {
             let (tool_count, server_count) = self.backend_counts();
-            build_meta_tools(
+            built_meta_tools = build_meta_tools(
                 self.stats.is_some(),
                 self.get_webhook_registry().is_some(),
                 self.get_reload_context().is_some(),
                 true, // cost_report always enabled (tracker is always present)
                 tool_count,
                 server_count,
-            )
+            );
+            &built_meta_tools
         };
         let mut tool_descriptors =
-            project_tool_descriptors_trust_cards("gateway:meta", "mcp-gateway", &tools);
+            project_tool_descriptors_trust_cards("gateway:meta", "mcp-gateway", tools);
 
         // Append surfaced tools (skip in Code Mode — it uses a fixed 2-tool schema).
         if !self.code_mode_enabled {
@@ -1097,9 +1099,9 @@ impl MetaMcp {
         let effective_code_mode = self.code_mode_enabled || url_override;
         if effective_code_mode && !self.code_mode_enabled {
             // URL-activated Code Mode: return the two fixed tools directly.
-            let tools = build_code_mode_tools();
+            let tools = code_mode_tools();
             let tool_descriptors =
-                project_tool_descriptors_trust_cards("gateway:meta", "mcp-gateway", &tools);
+                project_tool_descriptors_trust_cards("gateway:meta", "mcp-gateway", tools);
             return JsonRpcResponse::success(
                 id,
                 tools_list_result_with_trust_cards(tool_descriptors),
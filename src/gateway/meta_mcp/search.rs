@@ -23,13 +23,13 @@ use super::super::meta_mcp_helpers::{
     build_code_mode_match_json, build_match_json, build_match_json_with_chains,
     build_search_response, build_suggestions, extract_bool_or, extract_optional_str,
     extract_required_str, extract_search_limit, is_glob_pattern, parse_code_mode_tool_ref,
-    parse_tool_arguments, ranked_results_to_json, tool_matches_glob, tool_matches_query,
-    tool_name_matches_glob,
+    parse_tool_arguments, ranked_results_to_json, text_matches_query, tool_matches_glob,
+    tool_matches_query, tool_name_matches_glob,
 };
 use super::MetaMcp;
 use super::support::{
-    collect_tool_tags, collect_tool_tags_for_code_mode, json_to_code_mode_search_result,
-    ranked_results_to_code_mode_json,
+    collect_description_tags, collect_tool_tags, collect_tool_tags_for_code_mode,
+    json_to_code_mode_search_result, ranked_results_to_code_mode_json,
 };
 
 #[derive(Clone, Copy)]
@@ -334,24 +334,18 @@ impl MetaMcp {
             }
             let backend_killed = self.kill_switch.is_killed(&backend.name);
             if let Some(tools) = Self::backend_tools_for_discovery(&backend, false).await {
-                let enriched: Vec<_> = tools
-                    .iter()
-                    .filter(|t| profile.tool_allowed(&t.name))
-                    .map(|tool| {
-                        let mut t = tool.clone();
-                        if let Some(ref desc) = t.description {
-                            t.description = Some(autotag::enrich_description(desc));
-                        }
-                        t
-                    })
-                    .collect();
-
-                for tool in &enriched {
-                    collect_tool_tags(tool, all_tags);
-                }
-                for tool in enriched {
-                    if tool_matches_query(&tool, query) {
-                        let mut entry = build_match_json(&backend.name, &tool);
+                for tool in tools.iter().filter(|t| profile.tool_allowed(&t.name)) {
+                    // Enrich only the description; cloning every Tool (input
+                    // schema included) up front made non-matching tools the
+                    // dominant cost of a search across large backends.
+                    let description = tool.description.as_deref().map(autotag::enrich_description);
+                    if let Some(desc) = description.as_deref() {
+                        collect_description_tags(desc, all_tags);
+                    }
+                    if text_matches_query(&tool.name, description.as_deref(), query) {
+                        let mut enriched_tool = tool.clone();
+                        enriched_tool.description = description;
+                        let mut entry = build_match_json(&backend.name, &enriched_tool);
                         if backend_killed {
                             entry["status"] = json!("disabled");
                         }
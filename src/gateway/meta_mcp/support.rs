@@ -54,9 +54,14 @@ pub(super) fn resolve_idempotency_key(
 /// `CapabilityDefinition::to_mcp_tool()`. Tags are lowercased and hyphen-split
 /// parts are also collected so both "entity-discovery" and "entity" are indexed.
 pub(super) fn collect_tool_tags(tool: &crate::protocol::Tool, out: &mut Vec<String>) {
-    let Some(desc) = tool.description.as_deref() else {
-        return;
-    };
+    if let Some(desc) = tool.description.as_deref() {
+        collect_description_tags(desc, out);
+    }
+}
+
+/// Borrowed-slice form of [`collect_tool_tags`] for callers that hold an
+/// enriched description without a `Tool` around it.
+pub(super) fn collect_description_tags(desc: &str, out: &mut Vec<String>) {
     let Some(kw_start) = desc.find("[keywords:") else {
         return;
     };
@@ -24,6 +24,7 @@ pub(crate) use super::meta_mcp_tool_defs::{
     build_code_mode_tools, build_kill_server_tool, build_list_disabled_capabilities_tool,
     build_meta_tools, build_reload_capabilities_tool, build_reload_config_tool,
     build_revive_server_tool, build_set_state_tool, build_stats_tool, build_webhook_status_tool,
+    code_mode_tools,
 };
 
 // ============================================================================
@@ -350,8 +351,14 @@ fn glob_match_chars(text: &[char], pattern: &[char]) -> bool {
 /// case-insensitively in the tool name or description (including keyword tags).
 /// Single-word queries behave identically to the previous substring match.
 pub(crate) fn tool_matches_query(tool: &Tool, query: &str) -> bool {
-    let name_lower = tool.name.to_lowercase();
-    let desc_lower = tool.description.as_deref().unwrap_or("").to_lowercase();
+    text_matches_query(&tool.name, tool.description.as_deref(), query)
+}
+
+/// Borrowed-slice form of [`tool_matches_query`] for callers that have a
+/// (possibly enriched) description in hand but no `Tool` to wrap it in.
+pub(crate) fn text_matches_query(name: &str, description: Option<&str>, query: &str) -> bool {
+    let name_lower = name.to_lowercase();
+    let desc_lower = description.unwrap_or("").to_lowercase();
 
     query
         .split_whitespace()
@@ -660,7 +667,10 @@ pub(crate) fn wrap_tool_success(
 ) -> JsonRpcResponse {
     let result = ToolsCallResult {
         content: vec![Content::Text {
-            text: serde_json::to_string_pretty(content).unwrap_or_default(),
+            // Compact serialization: the text content is machine-consumed and
+            // re-enters the client's context window, so indentation is pure
+            // token/bandwidth overhead.
+            text: serde_json::to_string(content).unwrap_or_default(),
             annotations: None,
         }],
         structured_content: if has_output_schema {
@@ -258,14 +258,15 @@ fn wrap_tool_success_produces_valid_response() {
 }
 
 #[test]
-fn wrap_tool_success_content_is_pretty_json() {
+fn wrap_tool_success_content_is_compact_json() {
     let id = RequestId::Number(42);
     let content = json!({"key": "value"});
     let response = wrap_tool_success(id, &content, false);
 
     let result: ToolsCallResult = serde_json::from_value(response.result.unwrap()).unwrap();
     if let Content::Text { text, .. } = &result.content[0] {
-        assert!(text.contains('\n'));
+        // Compact form: no indentation whitespace billed to the client.
+        assert!(!text.contains('\n'));
         let parsed: Value = serde_json::from_str(text).unwrap();
         assert_eq!(parsed["key"], "value");
     } else {
@@ -6,6 +6,8 @@
 //! interface. Kept separate from the helper utilities so the schema definitions
 //! can be updated without touching the routing/search logic.
 
+use std::sync::LazyLock;
+
 use serde_json::json;
 
 use crate::protocol::{Tool, ToolAnnotations};
@@ -710,6 +712,16 @@ pub(crate) fn build_code_mode_tools() -> Vec<Tool> {
     ]
 }
 
+/// Cached Code Mode tool list.
+///
+/// Unlike the traditional meta-tools, the Code Mode definitions carry no live
+/// registry counts, so the two schemas are built once and shared across every
+/// `tools/list` response.
+pub(crate) fn code_mode_tools() -> &'static [Tool] {
+    static TOOLS: LazyLock<Vec<Tool>> = LazyLock::new(build_code_mode_tools);
+    &TOOLS
+}
+
 // ============================================================================
 // Tests (extracted to meta_mcp_tool_defs_tests.rs for LOC compliance)
 // ============================================================================
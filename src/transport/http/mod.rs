@@ -140,8 +140,12 @@ pub struct HttpTransport {
     base_url: String,
     /// Message endpoint URL (received from SSE handshake, or same as `base_url` for streamable)
     message_url: RwLock<Option<String>>,
-    /// Custom headers
-    headers: HashMap<String, String>,
+    /// Custom headers, pre-parsed into a [`header::HeaderMap`] once at
+    /// construction so the per-request header builder does not re-parse the
+    /// same name/value strings on every call. Entries that are not valid HTTP
+    /// header names/values are dropped here, matching the previous
+    /// per-request skip behavior.
+    custom_headers: header::HeaderMap,
     /// Per-caller-identity MCP session ids (MIK-6784).
     ///
     /// A single `HttpTransport` is Arc-shared across every gateway user for a
@@ -263,11 +267,21 @@ impl HttpTransport {
             .build()
             .map_err(|e| Error::Transport(e.to_string()))?;
 
+        let mut custom_headers = header::HeaderMap::with_capacity(headers.len());
+        for (key, value) in headers {
+            if let (Ok(k), Ok(v)) = (
+                key.parse::<header::HeaderName>(),
+                value.parse::<header::HeaderValue>(),
+            ) {
+                custom_headers.insert(k, v);
+            }
+        }
+
         Ok(Arc::new(Self {
             client,
             base_url: url.to_string(),
             message_url: RwLock::new(None),
-            headers,
+            custom_headers,
             sessions: RwLock::new(HashMap::new()),
             single_tenant_hint: AtomicBool::new(false),
             request_id: AtomicU64::new(1),
@@ -549,13 +563,8 @@ impl HttpTransport {
         // User-supplied custom headers apply to all calls, including
         // notifications, because some backends require the same auth header for
         // `notifications/initialized` as for normal requests.
-        for (key, value) in &self.headers {
-            if let (Ok(k), Ok(v)) = (
-                key.parse::<reqwest::header::HeaderName>(),
-                value.parse::<reqwest::header::HeaderValue>(),
-            ) {
-                headers.insert(k, v);
-            }
+        for (key, value) in &self.custom_headers {
+            headers.insert(key, value.clone());
         }
 
         // Ambient trace ID (send_request only; not SSE or notify).
@@ -652,13 +661,17 @@ impl HttpTransport {
                 )));
             }
 
-            // Process complete lines in the buffer
+            // Process complete lines in the buffer. Lines are examined as
+            // slices and consumed with drain() so non-data frames (comments,
+            // heartbeats, event tags) cost no allocation, and the remainder
+            // is shifted in place instead of re-copied into a fresh String
+            // per line.
             while let Some(newline_pos) = buffer.find('\n') {
-                let line = buffer[..newline_pos].trim().to_string();
-                buffer = buffer[newline_pos + 1..].to_string();
+                let line = buffer[..newline_pos].trim();
 
                 if line.is_empty() {
                     event_type = None;
+                    buffer.drain(..=newline_pos);
                     continue;
                 }
 
@@ -690,6 +703,7 @@ impl HttpTransport {
                         return Ok(data.to_string());
                     }
                 }
+                buffer.drain(..=newline_pos);
             }
         }
 
@@ -54,7 +54,7 @@ fn new_with_custom_headers() {
         false,
     )
     .unwrap();
-    assert_eq!(t.headers.get("X-Custom").unwrap(), "value");
+    assert_eq!(t.custom_headers.get("X-Custom").unwrap(), "value");
     assert!(!t.streamable_http);
 }
 
@@ -402,14 +402,16 @@ impl StdioTransport {
     /// Write a message to stdin
     async fn write_message(&self, message: &str) -> Result<()> {
         debug!(message_len = message.len(), message = %message, "Writing to stdin");
+        // Frame the message and trailing newline in one buffer so the whole
+        // JSON-RPC line goes out in a single write syscall (ChildStdin is
+        // unbuffered, so separate write_all calls each hit the pipe).
+        let mut frame = Vec::with_capacity(message.len() + 1);
+        frame.extend_from_slice(message.as_bytes());
+        frame.push(b'\n');
         let mut writer = self.writer.lock().await;
         if let Some(ref mut stdin) = *writer {
             stdin
-                .write_all(message.as_bytes())
-                .await
-                .map_err(|e| Error::Transport(e.to_string()))?;
-            stdin
-                .write_all(b"\n")
+                .write_all(&frame)
                 .await
                 .map_err(|e| Error::Transport(e.to_string()))?;
             stdin